@@ -1,3 +1,18 @@
-from .isolator import ApplicationIsolator
-from .config import IsolationConfig
+from typing import Any
+
 from .enums import DisplayServer, IsolationLevel, ApplicationProfile
+
+__all__ = [
+    'ApplicationIsolator', 'IsolationConfig',
+    'DisplayServer', 'IsolationLevel', 'ApplicationProfile',
+]
+
+def __getattr__(name: str) -> Any:
+    # The isolator pulls in every manager; import it only when it is used
+    if name == 'ApplicationIsolator':
+        from .isolator import ApplicationIsolator
+        return ApplicationIsolator
+    if name == 'IsolationConfig':
+        from .config import IsolationConfig
+        return IsolationConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
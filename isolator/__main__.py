@@ -1,13 +1,47 @@
 import argparse
 import sys
 from pathlib import Path
-from .config import IsolationConfig, ResourceLimits
 from .enums import IsolationLevel, ApplicationProfile
-from .isolator import ApplicationIsolator
 from .logging_config import setup_logging
 
+_PROFILE_BY_NAME = {p.name: p for p in ApplicationProfile}
+_LEVEL_BY_NAME = {level.name.lower(): level for level in IsolationLevel}
+_PROFILE_CHOICES = tuple(_PROFILE_BY_NAME)
+_LEVEL_CHOICES = tuple(_LEVEL_BY_NAME)
+
+# Defaults for every option, shared by the parser and the no-options fast
+# path so the two cannot drift apart; new options must be listed here
+_DEFAULTS = {
+    "profile": None,
+    "persist": None,
+    "no_network": False,
+    "no_gui": False,
+    "isolation_level": IsolationLevel.STANDARD.name.lower(),
+    "memory": None,
+    "cpu": None,
+    "io_weight": None,
+    "max_processes": None,
+    "debug": False,
+}
+
+def _io_weight(value: str) -> int:
+    """Parse an I/O weight, which cgroups accept in the range 10-1000."""
+    try:
+        weight = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if not 10 <= weight <= 1000:
+        raise argparse.ArgumentTypeError(f"I/O weight must be between 10 and 1000, got {weight}")
+    return weight
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments with comprehensive options."""
+    argv = sys.argv[1:]
+
+    # Fast path: a bare command without any options needs no parser
+    if argv and not any(arg.startswith("-") for arg in argv):
+        return argparse.Namespace(command=argv, **_DEFAULTS)
+
     parser = argparse.ArgumentParser(
         description="Run GUI applications in isolated environments with advanced containerization",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -21,7 +55,7 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument(
         "--profile",
-        choices=[p.name for p in ApplicationProfile],
+        choices=_PROFILE_CHOICES,
         help="Force specific application profile"
     )
 
@@ -46,8 +80,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--isolation-level",
         type=str,
-        choices=[level.name.lower() for level in IsolationLevel],
-        default=IsolationLevel.STANDARD.name.lower(),
+        choices=_LEVEL_CHOICES,
         help="Set isolation level"
     )
 
@@ -66,8 +99,7 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument(
         "--io-weight",
-        type=int,
-        choices=range(10, 1001),
+        type=_io_weight,
         help="I/O weight (10-1000)"
     )
 
@@ -83,11 +115,17 @@ def parse_args() -> argparse.Namespace:
         help="Enable debug logging"
     )
 
+    parser.set_defaults(**_DEFAULTS)
     return parser.parse_args()
 
 def main():
     """Main entry point."""
     args = parse_args()
+
+    # Imported after argument parsing so --help and usage errors stay fast
+    from .config import IsolationConfig, ResourceLimits
+    from .isolator import ApplicationIsolator
+
     setup_logging(args.debug)
 
     # Create resource limits if any are specified
@@ -105,9 +143,9 @@ def main():
         persist_dir=args.persist,
         network_enabled=not args.no_network,
         gui_enabled=not args.no_gui,
-        isolation_level=IsolationLevel[args.isolation_level.upper()],
+        isolation_level=_LEVEL_BY_NAME[args.isolation_level],
         debug=args.debug,
-        profile=ApplicationProfile[args.profile.upper()] if args.profile else None,
+        profile=_PROFILE_BY_NAME[args.profile] if args.profile else None,
         resource_limits=resource_limits
     )
 
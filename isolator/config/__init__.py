@@ -1,5 +1,13 @@
 """Configuration package for Isolator."""
+from typing import Any
+
 from .base import IsolationConfig, ResourceLimits
-from .profiles import ProfileConfig, ProfileManager
 
 __all__ = ['IsolationConfig', 'ProfileConfig', 'ProfileManager', 'ResourceLimits']
+
+def __getattr__(name: str) -> Any:
+    # Profile support is loaded on first use to keep CLI startup light
+    if name in ('ProfileConfig', 'ProfileManager'):
+        from . import profiles
+        return getattr(profiles, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
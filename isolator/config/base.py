@@ -1,9 +1,15 @@
+import os
+import stat
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Dict, Set
 from ..enums import IsolationLevel, ApplicationProfile
 
-@dataclass
+# dataclass(slots=True) is only available from Python 3.10 onwards
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class ResourceLimits:
     """Resource limits configuration."""
     memory_limit: Optional[str] = None  # e.g., "2G"
@@ -13,7 +19,7 @@ class ResourceLimits:
     max_file_size: Optional[str] = None # e.g., "1G"
     max_files: Optional[int] = None     # max number of open files
 
-@dataclass
+@dataclass(**_SLOTS)
 class IsolationConfig:
     """Configuration for application isolation with comprehensive options."""
     app_command: List[str]
@@ -34,14 +40,17 @@ class IsolationConfig:
 
         # Handle persist directory
         if self.persist_dir:
-            if isinstance(self.persist_dir, str):
-                self.persist_dir = Path(self.persist_dir)
             # Expand user path (e.g., ~/my-data -> /home/user/my-data)
-            self.persist_dir = self.persist_dir.expanduser()
-            # Create persist directory if it doesn't exist
-            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            self.persist_dir = Path(self.persist_dir).expanduser()
+            # Create persist directory only if it doesn't exist yet
+            try:
+                st = os.stat(self.persist_dir)
+            except FileNotFoundError:
+                self.persist_dir.mkdir(parents=True, exist_ok=True)
+            else:
+                if not stat.S_ISDIR(st.st_mode):
+                    raise NotADirectoryError(f"Persist path is not a directory: {self.persist_dir}")
 
         # Handle temporary directory
-        if isinstance(self.tmp_dir, str):
-            self.tmp_dir = Path(self.tmp_dir)
-            self.tmp_dir = self.tmp_dir.expanduser()
+        if self.tmp_dir:
+            self.tmp_dir = Path(self.tmp_dir).expanduser()
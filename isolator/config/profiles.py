@@ -1,11 +1,41 @@
 """Profile configuration management for Isolator."""
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, TextIO
+import json
+import logging
 import os
-import yaml
 from pathlib import Path
+from .base import _SLOTS
 
-@dataclass
+# Bump whenever the layout of the profile cache changes; caches written with
+# another version are discarded
+_CACHE_VERSION = 1
+
+def _yaml_load(text: str) -> Any:
+    """Parse YAML with the fastest available safe loader.
+
+    PyYAML is imported here rather than at module level so that code paths
+    which never touch profile files do not pay for importing it.
+    """
+    import yaml
+    loader: Any
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:  # PyYAML built without libyaml
+        loader = yaml.SafeLoader
+    return yaml.load(text, Loader=loader)
+
+def _yaml_dump(data: Dict[str, Any], stream: TextIO) -> None:
+    """Serialize data as YAML with the fastest available safe dumper."""
+    import yaml
+    dumper: Any
+    try:
+        dumper = yaml.CSafeDumper
+    except AttributeError:  # PyYAML built without libyaml
+        dumper = yaml.SafeDumper
+    yaml.dump(data, stream, Dumper=dumper, default_flow_style=False)
+
+@dataclass(frozen=True, **_SLOTS)
 class ProfileConfig:
     """Configuration for an application profile."""
     name: str
@@ -17,6 +47,25 @@ class ProfileConfig:
     network_ports: Optional[List[int]] = None
     resource_limits: Optional[Dict[str, str]] = None
 
+    def __post_init__(self) -> None:
+        """Validate capabilities and network ports once, at load time."""
+        for cap in self.capabilities:
+            if not cap.startswith("CAP_"):
+                raise ValueError(f"Invalid capability format: {cap}")
+
+        if self.network_ports:
+            for port in self.network_ports:
+                if not (0 <= port <= 65535):
+                    raise ValueError(f"Invalid port number: {port}")
+
+def _profile_to_dict(config: ProfileConfig) -> Dict:
+    """Return the profile fields as a flat dict for serialization.
+
+    All fields are plain values, so this avoids the recursive deep copy
+    done by dataclasses.asdict().
+    """
+    return {f.name: getattr(config, f.name) for f in fields(config)}
+
 class ProfileManager:
     """Manages application profiles and their configurations."""
     
@@ -26,22 +75,80 @@ class ProfileManager:
             Path("/etc/isolator/profiles"),
             Path.home() / ".config" / "isolator" / "profiles",
         ]
+        self._cache_path = Path.home() / ".cache" / "isolator" / "profiles.json"
         self._load_profiles()
 
     def _load_profiles(self):
-        """Load profiles from configuration files."""
+        """Load profiles from configuration files, reusing cached parses of unchanged files.
+
+        The cache only holds the parsed YAML data; every profile is still
+        built through ProfileConfig so its validation always runs.
+        """
+        cache = self._read_cache()
+        index: Dict[str, Dict[str, Any]] = {}
+
         for config_path in self.config_paths:
-            if not config_path.exists():
+            try:
+                entries = list(os.scandir(config_path))
+            except FileNotFoundError:
                 continue
-                
-            for profile_file in config_path.glob("*.yaml"):
+            except OSError as e:
+                logging.error(f"Failed to read profile directory {config_path}: {e}")
+                continue
+
+            for entry in entries:
+                if not entry.name.endswith(".yaml"):
+                    continue
                 try:
-                    with open(profile_file) as f:
-                        data = yaml.safe_load(f)
-                        profile = ProfileConfig(**data)
-                        self.profiles[profile.name] = profile
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    key = [st.st_mtime_ns, st.st_size]
+                    cached = cache.get(entry.path)
+                    if (isinstance(cached, dict) and cached.get("stat") == key
+                            and isinstance(cached.get("data"), dict)):
+                        data = cached["data"]
+                    else:
+                        with open(entry.path) as f:
+                            data = _yaml_load(f.read())
+                    profile = ProfileConfig(**data)
+                    index[entry.path] = {"stat": key, "data": data}
+                    self.profiles[profile.name] = profile
                 except Exception as e:
-                    logging.error(f"Failed to load profile {profile_file}: {e}")
+                    logging.error(f"Failed to load profile {entry.path}: {e}")
+
+        if index != cache:
+            self._write_cache(index)
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Read the profile cache, returning an empty index if unusable."""
+        try:
+            with open(self._cache_path) as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.debug(f"Ignoring unreadable profile cache {self._cache_path}: {e}")
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return {}
+        files = cache.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write_cache(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Persist the profile index, replacing the previous cache atomically."""
+        tmp_path = self._cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"version": _CACHE_VERSION, "files": index}, f)
+            os.replace(tmp_path, self._cache_path)
+        except Exception as e:
+            logging.debug(f"Failed to write profile cache {self._cache_path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def get_profile(self, name: str) -> Optional[ProfileConfig]:
         """Get a profile configuration by name."""
@@ -58,7 +165,7 @@ class ProfileManager:
         
         profile_path = config_dir / f"{config.name}.yaml"
         with open(profile_path, "w") as f:
-            yaml.dump(dataclasses.asdict(config), f)
+            _yaml_dump(_profile_to_dict(config), f)
             
         self.profiles[config.name] = config
         return True
@@ -73,7 +180,7 @@ class ProfileManager:
         profile_path = config_dir / f"{config.name}.yaml"
         
         with open(profile_path, "w") as f:
-            yaml.dump(dataclasses.asdict(config), f)
+            _yaml_dump(_profile_to_dict(config), f)
             
         self.profiles[config.name] = config
         return True
@@ -1,7 +1,9 @@
-import os
+import functools
 import logging
+import shlex
 import subprocess
 import sys
+from itertools import chain
 from typing import List, Optional
 from dataclasses import dataclass
 from .config import IsolationConfig, ProfileManager, ResourceLimits
@@ -11,6 +13,16 @@ from .managers.security_manager import SecurityManager
 from .managers.resource_manager import ResourceManager
 from .enums import ApplicationProfile
 
+# Display detection and parsed profiles do not change while the process runs,
+# so these managers are shared by every isolator (use cache_clear() to reset).
+@functools.lru_cache(maxsize=None)
+def _display_manager() -> DisplayManager:
+    return DisplayManager()
+
+@functools.lru_cache(maxsize=None)
+def _profile_manager() -> ProfileManager:
+    return ProfileManager()
+
 class ApplicationIsolator:
     """Main class for handling application isolation with enhanced features."""
 
@@ -19,12 +31,13 @@ class ApplicationIsolator:
         self.logger = logging.getLogger(__name__)
         
         # Initialize managers
-        self.display_manager = DisplayManager()
+        self.display_manager = _display_manager()
         self.filesystem_manager = FilesystemManager(config)
         
-        # Load profile configuration
-        self.profile_manager = ProfileManager()
-        self.profile_config = self.profile_manager.get_profile(str(config.profile)) if config.profile else None
+        # Load profile configuration only when a profile was requested
+        self.profile_config = None
+        if config.profile is not None:
+            self.profile_config = _profile_manager().get_profile(str(config.profile))
         
         # Initialize security manager with profile
         self.security_manager = SecurityManager(
@@ -45,7 +58,7 @@ class ApplicationIsolator:
             resolved_command = self.filesystem_manager.resolve_command(self.config.app_command)
             self.config.app_command = resolved_command
 
-            self.logger.debug(f"Resolved command: {resolved_command}")
+            self.logger.debug("Resolved command: %s", resolved_command)
             bwrap_args = self._prepare_bwrap_args()
             
             # Add browser-specific environment variables if needed
@@ -58,46 +71,40 @@ class ApplicationIsolator:
 
             return self._execute_bwrap(bwrap_args)
         except Exception as e:
-            self.logger.error(f"Failed to run isolated application: {e}")
+            self.logger.error("Failed to run isolated application: %s", e)
             return 1
         finally:
             self.cleanup()
 
     def _prepare_bwrap_args(self) -> List[str]:
         """Prepare complete bubblewrap command arguments with enhanced features."""
-        args = ["bwrap"]
-
         # Validate security configuration
         if not self.security_manager.validate_security_config():
             raise SecurityError("Invalid security configuration")
 
-        # Add filesystem setup first
-        args.extend(self.filesystem_manager.setup())
-
-        # Add display configuration if GUI is enabled
-        if self.config.gui_enabled:
-            args.extend(self.display_manager.get_display_args())
-
-        # Add security arguments
-        args.extend(self.security_manager.get_security_args())
-
-        # Add resource management arguments
-        args.extend(self.resource_manager.get_resource_args())
-
-        # Add the actual command to run
-        args.extend(self.config.app_command)
-
-        return args
+        return list(chain(
+            ("bwrap",),
+            # Add filesystem setup first
+            self.filesystem_manager.setup(),
+            # Add display configuration if GUI is enabled
+            self.display_manager.get_display_args() if self.config.gui_enabled else (),
+            # Add security arguments
+            self.security_manager.get_security_args(),
+            # Add resource management arguments
+            self.resource_manager.get_resource_args(),
+            # Add the actual command to run
+            self.config.app_command,
+        ))
 
     def _execute_bwrap(self, bwrap_args: List[str]) -> int:
         """Execute bubblewrap with prepared arguments."""
-        self.logger.debug(f"Executing: {' '.join(bwrap_args)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing: %s", shlex.join(bwrap_args))
 
         try:
-            # Use shell=False for better security
+            # Use shell=False for better security; the child inherits our environment
             process = subprocess.Popen(
                 bwrap_args,
-                env=os.environ.copy(),  # Pass current environment
                 shell=False
             )
             return process.wait()
@@ -105,10 +112,10 @@ class ApplicationIsolator:
             self.logger.info("Received interrupt signal, cleaning up...")
             return 130
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to execute bwrap: {e}")
+            self.logger.error("Failed to execute bwrap: %s", e)
             return e.returncode
         except Exception as e:
-            self.logger.error(f"Unexpected error: {e}")
+            self.logger.error("Unexpected error: %s", e)
             return 1
 
     def cleanup(self):
@@ -119,4 +126,4 @@ class ApplicationIsolator:
         # Log final resource usage
         if hasattr(self, 'resource_manager'):
             final_usage = self.resource_manager.monitor_resources()
-            self.logger.info(f"Final resource usage: {final_usage}")
\ No newline at end of file
+            self.logger.info("Final resource usage: %s", final_usage)
\ No newline at end of file
@@ -25,27 +25,27 @@ class DisplayManager:
         if self.display_server == DisplayServer.X11:
             self.logger.info("Configuring X11 display server")
             x11_socket = "/tmp/.X11-unix"
-            if os.path.exists(x11_socket):
+            if os.access(x11_socket, os.F_OK):
                 args.extend([
                     "--bind", x11_socket, x11_socket,
                     "--setenv", "DISPLAY", os.environ["DISPLAY"]
                 ])
 
                 xauth_path = os.path.expanduser("~/.Xauthority")
-                if os.path.exists(xauth_path):
+                if os.access(xauth_path, os.F_OK):
                     args.extend(["--ro-bind", xauth_path, xauth_path])
 
         elif self.display_server == DisplayServer.WAYLAND:
             self.logger.info("Configuring Wayland display server")
-            wayland_socket = os.path.join(
-                os.environ.get("XDG_RUNTIME_DIR", ""),
-                os.environ.get("WAYLAND_DISPLAY", "")
-            )
-            if os.path.exists(wayland_socket):
-                args.extend([
-                    "--bind", wayland_socket, wayland_socket,
-                    "--setenv", "WAYLAND_DISPLAY", os.environ["WAYLAND_DISPLAY"],
-                    "--setenv", "XDG_RUNTIME_DIR", os.environ["XDG_RUNTIME_DIR"]
-                ])
+            runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "")
+            wayland_display = os.environ.get("WAYLAND_DISPLAY", "")
+            if runtime_dir and wayland_display:
+                wayland_socket = os.path.join(runtime_dir, wayland_display)
+                if os.access(wayland_socket, os.F_OK):
+                    args.extend([
+                        "--bind", wayland_socket, wayland_socket,
+                        "--setenv", "WAYLAND_DISPLAY", wayland_display,
+                        "--setenv", "XDG_RUNTIME_DIR", runtime_dir
+                    ])
 
         return args
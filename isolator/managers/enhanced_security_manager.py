@@ -2,10 +2,41 @@
 import os
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from ..config.profiles import ProfileConfig
 from ..enums import IsolationLevel
 
+# Base security settings applied to all configurations
+_BASE_SECURITY = (
+    "--unshare-pid",      # Process namespace isolation
+    "--unshare-ipc",      # IPC namespace isolation
+    "--unshare-uts",      # UTS namespace isolation
+    "--proc", "/proc",    # Secure /proc mount
+    "--dev", "/dev",      # Secure /dev mount
+    "--new-session",      # New session
+    "--die-with-parent"   # Clean exit
+)
+
+_STRICT_ARGS = (
+    "--unshare-net",         # Network isolation
+    "--unshare-cgroup-try",  # cgroup isolation
+    "--cap-drop", "ALL"      # Drop all capabilities
+)
+
+_STRICT_USER_NS = (
+    "--unshare-user-try",    # User namespace isolation
+    "--hostname", "isolated"  # Set hostname
+)
+
+_STRICT_ARGS_WITH_USER_NS = _STRICT_ARGS + _STRICT_USER_NS
+
+# Standard isolation allows some network access but still maintains security
+_STANDARD_ARGS = (
+    "--share-net",           # Allow network
+    "--unshare-user-try",    # Try user namespace isolation
+    "--hostname", "isolated"  # Set hostname
+)
+
 class SecurityError(Exception):
     """Base class for security-related errors."""
     pass
@@ -50,17 +81,9 @@ class EnhancedSecurityManager:
             
         return args
 
-    def _get_base_security_args(self) -> List[str]:
+    def _get_base_security_args(self) -> Tuple[str, ...]:
         """Get base security arguments applied to all configurations."""
-        return [
-            "--unshare-pid",      # Process namespace isolation
-            "--unshare-ipc",      # IPC namespace isolation
-            "--unshare-uts",      # UTS namespace isolation
-            "--proc", "/proc",    # Secure /proc mount
-            "--dev", "/dev",      # Secure /dev mount
-            "--new-session",      # New session
-            "--die-with-parent"   # Clean exit
-        ]
+        return _BASE_SECURITY
 
     def _get_profile_security_args(self) -> List[str]:
         """Get security arguments based on the profile configuration."""
@@ -80,33 +103,18 @@ class EnhancedSecurityManager:
                 
         return args
 
-    def _get_isolation_level_args(self) -> List[str]:
+    def _get_isolation_level_args(self) -> Tuple[str, ...]:
         """Get security arguments based on isolation level."""
-        args = []
-        
         if self.isolation_level == IsolationLevel.STRICT:
-            args.extend([
-                "--unshare-net",         # Network isolation
-                "--unshare-cgroup-try",  # cgroup isolation
-                "--cap-drop", "ALL"      # Drop all capabilities
-            ])
-            
             # Additional strict mode settings
             if not self.profile or "CAP_SYS_ADMIN" not in self.profile.capabilities:
-                args.extend([
-                    "--unshare-user-try",    # User namespace isolation
-                    "--hostname", "isolated"  # Set hostname
-                ])
-                
+                return _STRICT_ARGS_WITH_USER_NS
+            return _STRICT_ARGS
+
         elif self.isolation_level == IsolationLevel.STANDARD:
-            # Standard isolation allows some network access but still maintains security
-            args.extend([
-                "--share-net",           # Allow network
-                "--unshare-user-try",    # Try user namespace isolation
-                "--hostname", "isolated"  # Set hostname
-            ])
-            
-        return args
+            return _STANDARD_ARGS
+
+        return ()
 
     def _get_seccomp_args(self) -> List[str]:
         """Get seccomp filtering arguments."""
@@ -123,21 +131,24 @@ class EnhancedSecurityManager:
         return []
 
     def validate_security_config(self) -> bool:
-        """Validate the security configuration."""
-        try:
-            if self.profile:
-                # Validate capabilities
-                for cap in self.profile.capabilities:
-                    if not cap.startswith("CAP_"):
-                        raise SecurityError(f"Invalid capability format: {cap}")
-                
-                # Validate network ports
-                if self.profile.network_ports:
-                    for port in self.profile.network_ports:
-                        if not (0 <= port <= 65535):
-                            raise SecurityError(f"Invalid port number: {port}")
-                            
-            return True
-        except Exception as e:
-            self.logger.error(f"Security validation failed: {e}")
-            return False
+        """Validate the security configuration.
+
+        ProfileConfig checks these at construction too, but its lists can
+        still be modified afterwards, so they are checked again before launch.
+        """
+        if self.profile:
+            # Validate capabilities
+            for cap in self.profile.capabilities:
+                if not cap.startswith("CAP_"):
+                    self.logger.error(
+                        "Security validation failed: Invalid capability format: %s", cap
+                    )
+                    return False
+
+            # Validate network ports
+            for port in self.profile.network_ports or ():
+                if not (0 <= port <= 65535):
+                    self.logger.error("Security validation failed: Invalid port number: %s", port)
+                    return False
+
+        return True
@@ -1,13 +1,246 @@
+import functools
 import os
 import shutil
 import tempfile
+import threading
 import logging
-import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Callable, List, Dict, FrozenSet, Optional, Tuple
 from ..config import IsolationConfig
 from .requirements_manager import RequirementsManager
 
+# The real uid and home directory cannot change under us, so look them up once
+_UID = os.getuid()
+_HOME = os.path.expanduser("~")
+
+# Essential system paths for binary execution (order matters); all of them
+# are entries of / so their existence can be read from one directory listing
+_ESSENTIAL_PATHS = (
+    # Core system directories with proper permissions
+    ("/sys", "/sys", False),   # Hardware and device information
+    
+    # System binaries and libraries
+    ("/usr", "/usr", False),
+    ("/bin", "/bin", False),
+    ("/sbin", "/sbin", False),
+    ("/lib", "/lib", False),
+    ("/lib64", "/lib64", False),
+    
+    # Additional system directories
+    ("/etc", "/etc", False),    # Configuration files
+    ("/opt", "/opt", False),    # Optional packages
+    ("/var", "/var", False),    # Variable data
+)
+
+# Essential device binds
+_DEV_BINDS = (
+    "/dev/shm",     # Shared memory
+    "/dev/dri",     # Graphics acceleration
+    "/dev/null",    # Null device
+    "/dev/zero",    # Zero device
+    "/dev/random",  # Random device
+    "/dev/urandom"  # Urandom device
+)
+
+# Common binary locations and application-specific paths
+_EXTRA_PATHS = (
+    # Common binary and library locations
+    "/usr/local/bin",
+    "/usr/local/sbin",
+    "/usr/local/lib",
+    "/usr/local/lib64",
+    "/usr/local/share",
+    "/usr/lib/mozilla",
+    "/usr/lib/firefox",
+    "/usr/lib/chromium",
+    
+    # Runtime and configuration
+    "/run",
+    "/run/dbus",
+    "/run/user",
+    
+    # Font configuration
+    "/usr/share/fonts",
+    "/usr/share/icons",
+    "/usr/share/themes",
+    "/usr/share/fontconfig",
+    "/etc/fonts",
+    "/var/cache/fontconfig",
+    
+    # Application data
+    "/usr/share/applications",
+    "/usr/share/mime",
+    "/usr/share/X11",
+    "/usr/share/glib-2.0",
+    "/usr/share/gtk-2.0",
+    "/usr/share/gtk-3.0",
+    "/usr/share/gtk-4.0",
+    "/usr/share/chrome",
+    "/usr/share/chromium",
+)
+
+# User configuration (relative to home) that gets a writable overlay
+_USER_CONFIG_SUFFIXES = (
+    ".config",
+    ".local/share",
+    ".cache",
+    ".mozilla",
+    ".pki",
+    ".chrome",
+    ".config/google-chrome"
+)
+
+# (suffix, overlay directory name) pairs; flattening the whole relative path
+# keeps nested entries such as .config/google-chrome distinct from .config
+_USER_CONFIG_OVERLAYS = tuple(
+    (suffix, suffix.replace("/", "_")) for suffix in _USER_CONFIG_SUFFIXES
+)
+
+# Directories created in persist_dir and bound over the home directory
+_PERSIST_DIRS = (
+    ".config",
+    ".cache",
+    ".local/share",
+    ".mozilla",
+    ".pki",
+    ".chrome",
+    ".config/google-chrome",
+    "Downloads",  # Common download directory
+    "Documents"   # Common documents directory
+)
+
+# Runtime subdirectories of XDG_RUNTIME_DIR worth reporting
+_RUNTIME_SUBDIRS = (
+    "pulse",    # PulseAudio
+    "bus",     # D-Bus
+    "gnupg",   # GnuPG
+    "at-spi",  # Accessibility
+    "dconf"    # GSettings
+)
+
+# shutil.which results keyed on (name, PATH); a changed PATH gets new slots
+_WHICH_CACHE: Dict[Tuple[str, str], Optional[str]] = {}
+
+def _cached_which(name: str) -> Optional[str]:
+    """Look up name on the current PATH, remembering the answer per PATH value."""
+    path_env = os.environ.get("PATH", "")
+    key = (name, path_env)
+    if key in _WHICH_CACHE:
+        return _WHICH_CACHE[key]
+    full_path = _WHICH_CACHE[key] = shutil.which(name, path=path_env)
+    return full_path
+
+@functools.lru_cache(maxsize=256)
+def _exists_cached(path: str) -> bool:
+    """os.path.exists for system paths that do not come and go while we run.
+
+    Only meant for the fixed system tables; paths under the home or the
+    user's runtime directory can appear between sandboxes and must be
+    checked afresh. Call _exists_cached.cache_clear() to forget previous
+    answers.
+    """
+    return os.path.exists(path)
+
+@functools.lru_cache(maxsize=1)
+def _root_entries() -> FrozenSet[str]:
+    """Names of the entries in /, read with a single directory scan.
+
+    Symlinks (e.g. /lib64 on merged-/usr systems) only count when their
+    target exists, matching os.path.exists; bwrap cannot bind a dangling one.
+    """
+    try:
+        with os.scandir("/") as it:
+            return frozenset(
+                entry.name for entry in it
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            )
+    except OSError:
+        return frozenset()
+
+@functools.lru_cache(maxsize=1)
+def _extra_mounts() -> Tuple[str, ...]:
+    """Existing extra paths that are not already inside a read-only mount.
+
+    Binds are recursive, so e.g. /usr/share/fonts is visible through the
+    /usr bind and mounting it again only costs bwrap another mount().
+    """
+    root_entries = _root_entries()
+    mounted = [
+        src for src, _, writable in _ESSENTIAL_PATHS
+        if not writable and src[1:] in root_entries
+    ]
+    extra = []
+    for path in _EXTRA_PATHS:
+        if not _exists_cached(path):
+            continue
+        if any(path.startswith(parent + "/") for parent in mounted):
+            continue
+        mounted.append(path)
+        extra.append(path)
+    return tuple(extra)
+
+def _find_binary_scandir(root: str, name: str,
+                         stop: Optional[threading.Event] = None) -> Optional[str]:
+    """Breadth-first search below root for an executable file called name.
+
+    Uses os.scandir so file type checks come from the directory entries
+    rather than extra stat() calls. Symlinked directories are not descended
+    into, which also keeps the search from looping. The search gives up
+    early once stop is set.
+    """
+    pending = deque([root])
+    while pending:
+        if stop is not None and stop.is_set():
+            return None
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.name == name and entry.is_file():
+                            if os.access(entry.path, os.X_OK):
+                                return entry.path
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            # Missing or unreadable directory
+            continue
+    return None
+
+def _remove_tree(top: Path, on_error: Callable[[str, OSError], None]) -> bool:
+    """Delete a directory tree bottom-up, reporting failures to on_error.
+
+    os.fwalk keeps a descriptor open for each directory, so entries are
+    removed with unlink/rmdir relative to it instead of by full path. It
+    never follows symlinks while descending. Returns True only if the whole
+    tree was removed.
+    """
+    try:
+        for root, dirs, files, root_fd in os.fwalk(top, topdown=False):
+            for name in files:
+                try:
+                    os.unlink(name, dir_fd=root_fd)
+                except OSError as e:
+                    on_error(os.path.join(root, name), e)
+            for name in dirs:
+                try:
+                    try:
+                        os.rmdir(name, dir_fd=root_fd)
+                    except NotADirectoryError:
+                        # fwalk lists symlinks to directories among dirs
+                        os.unlink(name, dir_fd=root_fd)
+                except OSError as e:
+                    on_error(os.path.join(root, name), e)
+        os.rmdir(top)
+    except OSError as e:
+        on_error(str(top), e)
+        return False
+    return True
+
 class FilesystemManager:
     """Enhanced filesystem manager with profile-based isolation."""
 
@@ -15,7 +248,7 @@ class FilesystemManager:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.temp_dirs: List[Path] = []
-        self.user_runtime_dir = os.path.join('/run/user', str(os.getuid()))
+        self.user_runtime_dir = os.path.join('/run/user', str(_UID))
         self.requirements_manager = RequirementsManager()
 
     def _create_temp_dirs(self) -> List[Path]:
@@ -26,17 +259,26 @@ class FilesystemManager:
         else:
             temp_dir = Path(tempfile.mkdtemp())
             temp_dirs.append(temp_dir)
-            self.logger.debug(f"Created temporary directory: {temp_dir}")
+            self.logger.debug("Created temporary directory: %s", temp_dir)
         return temp_dirs
 
     def cleanup(self):
-        """Clean up temporary directories."""
+        """Clean up the temporary directories we created."""
+        # A user-supplied tmp_dir is not ours to delete
+        user_tmp_dir = Path(self.config.tmp_dir) if self.config.tmp_dir else None
         for temp_dir in self.temp_dirs:
-            try:
-                shutil.rmtree(temp_dir)
-                self.logger.debug(f"Removed temporary directory: {temp_dir}")
-            except Exception as e:
-                self.logger.warning(f"Failed to remove temporary directory {temp_dir}: {e}")
+            if temp_dir != user_tmp_dir:
+                self._remove_temp_dir(temp_dir)
+
+    def _remove_temp_dir(self, temp_dir: Path) -> None:
+        """Remove a temporary directory tree, logging anything left behind."""
+        def log_failure(path: str, exc: OSError) -> None:
+            self.logger.warning(
+                "Failed to remove %s from temporary directory %s: %s", path, temp_dir, exc
+            )
+
+        if _remove_tree(temp_dir, log_failure):
+            self.logger.debug("Removed temporary directory: %s", temp_dir)
 
     def resolve_command(self, command: List[str]) -> List[str]:
         """Resolve command path and return full command with arguments."""
@@ -45,14 +287,17 @@ class FilesystemManager:
 
         # Try to find the binary in common locations
         binary_name = command[0]
-        if not os.path.isabs(binary_name):
-            # First try which command
-            try:
-                full_path = subprocess.check_output(["which", binary_name]).decode().strip()
-                self.logger.debug(f"Found binary using which: {full_path}")
+        if os.path.isabs(binary_name):
+            # An absolute path needs no lookup, only a check that we can run it
+            if not os.access(binary_name, os.X_OK):
+                raise FileNotFoundError(f"Command not found or not executable: {binary_name}")
+        else:
+            # First look the binary up on PATH
+            full_path = _cached_which(binary_name)
+            if full_path:
+                self.logger.debug("Found binary on PATH: %s", full_path)
                 return [full_path] + command[1:]
-            except subprocess.CalledProcessError:
-                self.logger.debug(f"Binary not found using which: {binary_name}")
+            self.logger.debug("Binary not found on PATH: %s", binary_name)
 
             # Search in common locations
             search_paths = [
@@ -65,24 +310,33 @@ class FilesystemManager:
                 "/usr/local/lib",
             ]
 
-            # Try both direct path and subdirectories
-            for path in search_paths:
-                # Try direct path
-                full_path = os.path.join(path, binary_name)
-                if os.path.exists(full_path) and os.access(full_path, os.X_OK):
-                    self.logger.debug(f"Found binary in {path}: {full_path}")
-                    return [full_path] + command[1:]
-
-                # Search in subdirectories
-                if os.path.exists(path):
-                    for root, _, files in os.walk(path, followlinks=True):
-                        if binary_name in files:
-                            full_path = os.path.join(root, binary_name)
-                            if os.access(full_path, os.X_OK):
-                                self.logger.debug(f"Found binary in subdirectory: {full_path}")
-                                return [full_path] + command[1:]
-
-            self.logger.warning(f"Binary not found in common locations: {binary_name}")
+            # Walk all locations concurrently (directory reads release the
+            # GIL), but still prefer matches in search_paths order
+            stop = threading.Event()
+            with ThreadPoolExecutor(max_workers=len(search_paths)) as executor:
+                searches = [
+                    executor.submit(_find_binary_scandir, path, binary_name, stop)
+                    for path in search_paths
+                ]
+                try:
+                    # Try both direct path and subdirectories
+                    for path, search in zip(search_paths, searches):
+                        # Try direct path (access() fails for missing files too)
+                        full_path = os.path.join(path, binary_name)
+                        if os.access(full_path, os.X_OK):
+                            self.logger.debug("Found binary in %s: %s", path, full_path)
+                            return [full_path] + command[1:]
+
+                        # Search in subdirectories
+                        full_path = search.result()
+                        if full_path:
+                            self.logger.debug("Found binary in subdirectory: %s", full_path)
+                            return [full_path] + command[1:]
+                finally:
+                    # Let the remaining searches bail out before the pool shuts down
+                    stop.set()
+
+            self.logger.warning("Binary not found in common locations: %s", binary_name)
 
         # If we reach here, use the command as is
         return command
@@ -108,117 +362,65 @@ class FilesystemManager:
         # Set up /dev with necessary devices
         args.extend(["--dev", "/dev"])
         
-        # Essential system paths for binary execution (order matters)
-        essential_paths = [
-            # Core system directories with proper permissions
-            ("/sys", "/sys", False),   # Hardware and device information
-            
-            # System binaries and libraries
-            ("/usr", "/usr", False),
-            ("/bin", "/bin", False),
-            ("/sbin", "/sbin", False),
-            ("/lib", "/lib", False),
-            ("/lib64", "/lib64", False),
-            
-            # Additional system directories
-            ("/etc", "/etc", False),    # Configuration files
-            ("/opt", "/opt", False),    # Optional packages
-            ("/var", "/var", False),    # Variable data
-            
-            # Home directory for user data
-            (os.path.expanduser("~"), os.path.expanduser("~"), True),  # User's home needs to be writable
-        ]
+        # Per-mount diagnostics are only worth building with debug logging on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Mount essential paths with proper permissions
-        for src, dest, writable in essential_paths:
-            if os.path.exists(src):
-                if writable:
-                    args.extend(["--bind", src, dest])
-                    self.logger.debug(f"Mounted {src} to {dest} (writable)")
+        root_entries = _root_entries()
+        args.extend(
+            arg
+            for src, dest, writable in _ESSENTIAL_PATHS
+            if src[1:] in root_entries
+            for arg in ("--bind" if writable else "--ro-bind", src, dest)
+        )
+        if debug:
+            for src, dest, writable in _ESSENTIAL_PATHS:
+                if src[1:] in root_entries:
+                    mode = "writable" if writable else "read-only"
+                    self.logger.debug("Mounted %s to %s (%s)", src, dest, mode)
                 else:
-                    args.extend(["--ro-bind", src, dest])
-                    self.logger.debug(f"Mounted {src} to {dest} (read-only)")
-            else:
-                self.logger.debug(f"Path not found: {src}")
-
-        # Add essential device binds
-        dev_binds = [
-            "/dev/shm",     # Shared memory
-            "/dev/dri",     # Graphics acceleration
-            "/dev/null",    # Null device
-            "/dev/zero",    # Zero device
-            "/dev/random",  # Random device
-            "/dev/urandom"  # Urandom device
-        ]
-
-        for dev_path in dev_binds:
-            if os.path.exists(dev_path):
-                args.extend(["--dev-bind", dev_path, dev_path])
-                self.logger.debug(f"Mounted device: {dev_path}")
+                    self.logger.debug("Path not found: %s", src)
 
+        # Home directory for user data; it needs to be writable
+        if os.path.exists(_HOME):
+            args.extend(["--bind", _HOME, _HOME])
+            if debug:
+                self.logger.debug("Mounted %s to %s (writable)", _HOME, _HOME)
+        elif debug:
+            self.logger.debug("Path not found: %s", _HOME)
 
+        # Add essential device binds
+        args.extend(
+            arg
+            for dev_path in _DEV_BINDS
+            if _exists_cached(dev_path)
+            for arg in ("--dev-bind", dev_path, dev_path)
+        )
+        if debug:
+            for dev_path in _DEV_BINDS:
+                if _exists_cached(dev_path):
+                    self.logger.debug("Mounted device: %s", dev_path)
 
         # Add common binary locations and application-specific paths
-        extra_paths = [
-            # Common binary and library locations
-            "/usr/local/bin",
-            "/usr/local/sbin",
-            "/usr/local/lib",
-            "/usr/local/lib64",
-            "/usr/local/share",
-            "/usr/lib/mozilla",
-            "/usr/lib/firefox",
-            "/usr/lib/chromium",
-            
-            # Runtime and configuration
-            "/run",
-            "/run/dbus",
-            "/run/user",
-            
-            # Font configuration
-            "/usr/share/fonts",
-            "/usr/share/icons",
-            "/usr/share/themes",
-            "/usr/share/fontconfig",
-            "/etc/fonts",
-            "/var/cache/fontconfig",
-            
-            # Application data
-            "/usr/share/applications",
-            "/usr/share/mime",
-            "/usr/share/X11",
-            "/usr/share/glib-2.0",
-            "/usr/share/gtk-2.0",
-            "/usr/share/gtk-3.0",
-            "/usr/share/gtk-4.0",
-            "/usr/share/chrome",
-            "/usr/share/chromium",
-        ]
-        
-        for path in extra_paths:
-            if os.path.exists(path):
-                args.extend(["--ro-bind", path, path])
-                self.logger.debug(f"Mounted extra path: {path}")
+        extra_mounts = _extra_mounts()
+        args.extend(
+            arg
+            for path in extra_mounts
+            for arg in ("--ro-bind", path, path)
+        )
+        if debug:
+            for path in extra_mounts:
+                self.logger.debug("Mounted extra path: %s", path)
 
         # User configuration with writable overlay
-        user_config_paths = [
-            "~/.config",
-            "~/.local/share",
-            "~/.cache",
-            "~/.mozilla",
-            "~/.pki",
-            "~/.chrome",
-            "~/.config/google-chrome"
-        ]
-
-        for path in user_config_paths:
-            full_path = os.path.expanduser(path)
+        for suffix, overlay_name in _USER_CONFIG_OVERLAYS:
+            full_path = os.path.join(_HOME, suffix)
             if os.path.exists(full_path):
                 # Create temporary overlay for writable access
-                temp_path = os.path.join(self.temp_dirs[0], os.path.basename(path))
+                temp_path = os.path.join(self.temp_dirs[0], overlay_name)
                 os.makedirs(temp_path, exist_ok=True)
                 args.extend(["--bind", temp_path, full_path])
-                self.logger.debug(f"Mounted writable overlay for {full_path}")
+                self.logger.debug("Mounted writable overlay for %s", full_path)
         
         # Set up D-Bus and runtime directories
         args.extend(self._setup_dbus())
@@ -241,11 +443,11 @@ class FilesystemManager:
         args = []
 
         # Mount the D-Bus system socket
-        if os.path.exists("/run/dbus"):
+        if _exists_cached("/run/dbus"):
             args.extend(["--bind", "/run/dbus", "/run/dbus"])
 
         # Mount only the user's D-Bus socket
-        dbus_socket = f"/run/user/{os.getuid()}/bus"
+        dbus_socket = f"/run/user/{_UID}/bus"
         if os.path.exists(dbus_socket):
             args.extend(["--bind", dbus_socket, dbus_socket])
 
@@ -270,33 +472,20 @@ class FilesystemManager:
     def _setup_overlay(self) -> List[str]:
         """Set up overlay filesystem for writable layers."""
         args = []
-        home = os.path.expanduser("~")
+        home = Path(_HOME)
 
         if self.config.persist_dir:
             persist_dir = self.config.persist_dir
 
-            # Create necessary subdirectories in persist_dir for common paths
-            app_dirs = [
-                ".config",
-                ".cache",
-                ".local/share",
-                ".mozilla",
-                ".pki",
-                ".chrome",
-                ".config/google-chrome",
-                "Downloads",  # Common download directory
-                "Documents"   # Common documents directory
-            ]
-
             # Create all necessary directories in persist_dir
-            for app_dir in app_dirs:
+            for app_dir in _PERSIST_DIRS:
                 dir_path = persist_dir / app_dir
                 dir_path.mkdir(parents=True, exist_ok=True)
-                target = Path(home) / app_dir
-                self.logger.debug(f"Created persistent directory: {dir_path}")
+                target = home / app_dir
+                self.logger.debug("Created persistent directory: %s", dir_path)
                 args.extend(["--bind", str(dir_path), str(target)])
 
-            self.logger.debug(f"Set up persistent storage in {persist_dir}")
+            self.logger.debug("Set up persistent storage in %s", persist_dir)
         else:
             # For non-persistent mode, use temporary directories
             temp_dir = Path(tempfile.mkdtemp())
@@ -309,9 +498,9 @@ class FilesystemManager:
             
             for dir_path in [config_dir, cache_dir, local_share]:
                 dir_path.mkdir(parents=True, exist_ok=True)
-                args.extend(["--bind", str(dir_path), str(Path(home) / dir_path.relative_to(temp_dir))])
+                args.extend(["--bind", str(dir_path), str(home / dir_path.relative_to(temp_dir))])
 
-            self.logger.debug(f"Using temporary directory for storage: {temp_dir}")
+            self.logger.debug("Using temporary directory for storage: %s", temp_dir)
 
         return args
 
@@ -320,27 +509,19 @@ class FilesystemManager:
         args = []
 
         # Set up XDG_RUNTIME_DIR with proper user ID
-        uid = os.getuid()
-        user_runtime_dir = f"/run/user/{uid}"
+        user_runtime_dir = f"/run/user/{_UID}"
         
         if os.path.exists(user_runtime_dir):
             # Mount the entire runtime directory once
             args.extend(["--bind", user_runtime_dir, user_runtime_dir])
             
-            # Set up specific runtime subdirectories if they exist
-            runtime_subdirs = [
-                "pulse",    # PulseAudio
-                "bus",     # D-Bus
-                "gnupg",   # GnuPG
-                "at-spi",  # Accessibility
-                "dconf"    # GSettings
-            ]
-            
-            for subdir in runtime_subdirs:
-                dir_path = os.path.join(user_runtime_dir, subdir)
-                if os.path.exists(dir_path):
-                    self.logger.debug(f"Runtime subdir exists: {dir_path}")
+            # Report specific runtime subdirectories if they exist
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for subdir in _RUNTIME_SUBDIRS:
+                    dir_path = os.path.join(user_runtime_dir, subdir)
+                    if os.path.exists(dir_path):
+                        self.logger.debug("Runtime subdir exists: %s", dir_path)
         else:
-            self.logger.warning(f"XDG_RUNTIME_DIR {user_runtime_dir} does not exist")
+            self.logger.warning("XDG_RUNTIME_DIR %s does not exist", user_runtime_dir)
 
         return args
@@ -1,95 +1,113 @@
 import os
 import pwd
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping
 from dataclasses import dataclass, field
 from ..enums import ApplicationProfile
 
-@dataclass
+_UID = os.getuid()
+try:
+    _USERNAME = pwd.getpwuid(_UID).pw_name
+except KeyError:  # uid without a passwd entry, e.g. inside containers
+    _USERNAME = str(_UID)
+
+@dataclass(frozen=True)
 class SystemRequirement:
-    """System requirements for application isolation."""
-    paths: Set[str] = field(default_factory=set)
-    devices: Set[str] = field(default_factory=set)
-    env_vars: Dict[str, str] = field(default_factory=dict)
-    capabilities: Set[str] = field(default_factory=set)
+    """System requirements for application isolation.
 
-class RequirementsManager:
-    """Manages system requirements for different application types."""
+    Frozen so requirements can be shared and used as cache keys; env_vars
+    is a dict and therefore left out of the hash.
+    """
+    paths: FrozenSet[str] = field(default_factory=frozenset)
+    devices: FrozenSet[str] = field(default_factory=frozenset)
+    env_vars: Dict[str, str] = field(default_factory=dict, hash=False)
+    capabilities: FrozenSet[str] = field(default_factory=frozenset)
 
-    def __init__(self):
-        self.profiles: Dict[ApplicationProfile, SystemRequirement] = self._initialize_profiles()
+# Requirements are static, so they are built once and shared read-only
+_PROFILES: Mapping[ApplicationProfile, SystemRequirement] = MappingProxyType({
+    ApplicationProfile.BASIC: SystemRequirement(
+        paths=frozenset({"/usr", "/etc", "/opt", "/bin", "/lib", "/lib64"}),
+        devices=frozenset({"/dev/dri"}),
+        env_vars={"NO_AT_BRIDGE": "1"}
+    ),
+
+    ApplicationProfile.BROWSER: SystemRequirement(
+        paths=frozenset({
+            # Base system paths
+            "/usr", "/etc", "/opt", "/bin", "/lib", "/lib64",
+            "/usr/lib", "/usr/lib64", "/usr/local/lib", "/usr/local/lib64",
+            "/usr/share", "/usr/local/share",
+            
+            # System devices and runtime
+            "/sys/dev", "/sys/devices", "/run/dbus", "/run/user",
+            "/var/run/dbus", "/var/lib/dbus",
+            
+            # Font configuration
+            "/etc/fonts", "/usr/share/fonts", "/var/cache/fontconfig",
+            "/usr/share/fontconfig", "/usr/share/icons", "/usr/share/themes",
+            
+            # Application specific
+            "/usr/share/applications", "/usr/share/mime",
+            "/usr/share/mozilla", "/usr/lib/mozilla", "/usr/lib/firefox",
+            "/usr/share/glib-2.0", "/usr/share/gtk-3.0",
+            
+            # User configuration
+            f"/home/{_USERNAME}/.mozilla",
+            f"/home/{_USERNAME}/.config",
+            f"/home/{_USERNAME}/.cache",
+            f"/home/{_USERNAME}/.local/share"
+        }),
+        devices=frozenset({"/dev/dri", "/dev/shm"}),
+        env_vars={
+            "NO_AT_BRIDGE": "1",
+            "FONTCONFIG_PATH": "/etc/fonts",
+            "CHROME_WRAPPER": "1"
+        },
+        capabilities=frozenset({"net_admin"})
+    ),
 
-    def _initialize_profiles(self) -> Dict[ApplicationProfile, SystemRequirement]:
-        profiles = {}
+    ApplicationProfile.MULTIMEDIA: SystemRequirement(
+        paths=frozenset({
+            "/usr", "/etc", "/opt", "/bin", "/lib", "/lib64",
+            "/run/dbus", "/run/user", "/etc/machine-id"
+        }),
+        devices=frozenset({"/dev/dri", "/dev/snd"}),
+        env_vars={"PULSE_SERVER": "unix:/run/user/1000/pulse/native"}
+    ),
+})
 
-        profiles[ApplicationProfile.BASIC] = SystemRequirement(
-            paths={"/usr", "/etc", "/opt", "/bin", "/lib", "/lib64"},
-            devices={"/dev/dri"},
-            env_vars={"NO_AT_BRIDGE": "1"}
-        )
+# Known application names per profile, in detection priority order
+_APP_NAMES = (
+    (ApplicationProfile.BROWSER, ("chrome", "firefox", "chromium", "opera", "brave")),
+    (ApplicationProfile.MULTIMEDIA, ("vlc", "mpv", "audacity", "obs")),
+    (ApplicationProfile.DEVELOPMENT, ("code", "idea", "pycharm", "eclipse")),
+    (ApplicationProfile.GRAPHICS, ("gimp", "inkscape", "krita", "blender")),
+)
 
-        browser_req = SystemRequirement(
-            paths={
-                # Base system paths
-                "/usr", "/etc", "/opt", "/bin", "/lib", "/lib64",
-                "/usr/lib", "/usr/lib64", "/usr/local/lib", "/usr/local/lib64",
-                "/usr/share", "/usr/local/share",
-                
-                # System devices and runtime
-                "/sys/dev", "/sys/devices", "/run/dbus", "/run/user",
-                "/var/run/dbus", "/var/lib/dbus",
-                
-                # Font configuration
-                "/etc/fonts", "/usr/share/fonts", "/var/cache/fontconfig",
-                "/usr/share/fontconfig", "/usr/share/icons", "/usr/share/themes",
-                
-                # Application specific
-                "/usr/share/applications", "/usr/share/mime",
-                "/usr/share/mozilla", "/usr/lib/mozilla", "/usr/lib/firefox",
-                "/usr/share/glib-2.0", "/usr/share/gtk-3.0",
-                
-                # User configuration
-                f"/home/{pwd.getpwuid(os.getuid()).pw_name}/.mozilla",
-                f"/home/{pwd.getpwuid(os.getuid()).pw_name}/.config",
-                f"/home/{pwd.getpwuid(os.getuid()).pw_name}/.cache",
-                f"/home/{pwd.getpwuid(os.getuid()).pw_name}/.local/share"
-            },
-            devices={"/dev/dri", "/dev/shm"},
-            env_vars={
-                "NO_AT_BRIDGE": "1",
-                "FONTCONFIG_PATH": "/etc/fonts",
-                "CHROME_WRAPPER": "1"
-            },
-            capabilities={"net_admin"}
-        )
-        profiles[ApplicationProfile.BROWSER] = browser_req
+_PROFILE_BY_APP_NAME = {
+    name: profile
+    for profile, names in _APP_NAMES
+    for name in names
+}
 
-        profiles[ApplicationProfile.MULTIMEDIA] = SystemRequirement(
-            paths={
-                "/usr", "/etc", "/opt", "/bin", "/lib", "/lib64",
-                "/run/dbus", "/run/user", "/etc/machine-id"
-            },
-            devices={"/dev/dri", "/dev/snd"},
-            env_vars={"PULSE_SERVER": "unix:/run/user/1000/pulse/native"}
-        )
+class RequirementsManager:
+    """Manages system requirements for different application types."""
 
-        return profiles
+    def __init__(self):
+        self.profiles: Mapping[ApplicationProfile, SystemRequirement] = _PROFILES
 
     def detect_profile(self, command: str) -> ApplicationProfile:
         """Automatically detect appropriate profile for an application."""
-        browsers = {"chrome", "firefox", "chromium", "opera", "brave"}
-        multimedia = {"vlc", "mpv", "audacity", "obs"}
-        development = {"code", "idea", "pycharm", "eclipse"}
-        graphics = {"gimp", "inkscape", "krita", "blender"}
-
         cmd_base = os.path.basename(command).lower()
 
-        if any(browser in cmd_base for browser in browsers):
-            return ApplicationProfile.BROWSER
-        elif any(app in cmd_base for app in multimedia):
-            return ApplicationProfile.MULTIMEDIA
-        elif any(app in cmd_base for app in development):
-            return ApplicationProfile.DEVELOPMENT
-        elif any(app in cmd_base for app in graphics):
-            return ApplicationProfile.GRAPHICS
+        # Exact names are the common case; fall back to substring matching
+        # for variants such as "firefox-esr" or "google-chrome-stable"
+        profile = _PROFILE_BY_APP_NAME.get(cmd_base)
+        if profile is not None:
+            return profile
+
+        for profile, names in _APP_NAMES:
+            if any(name in cmd_base for name in names):
+                return profile
 
         return ApplicationProfile.BASIC
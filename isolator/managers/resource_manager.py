@@ -1,150 +1,178 @@
 """Resource management for Isolator."""
 import os
+import re
+import functools
 import logging
-from dataclasses import dataclass
-from typing import List, Optional, Dict
-from pathlib import Path
-
-@dataclass
-class ResourceLimits:
-    """Resource limits configuration."""
-    memory_limit: Optional[str] = None  # e.g., "2G"
-    cpu_limit: Optional[int] = None     # percentage
-    io_weight: Optional[int] = None     # 10-1000
-    max_processes: Optional[int] = None  # max number of processes
-    max_file_size: Optional[str] = None # e.g., "1G"
-    max_files: Optional[int] = None     # max number of open files
+from typing import Any, List, Optional, Dict, Tuple
+from ..config.base import ResourceLimits
+
+try:
+    import psutil
+except ImportError:  # CPU and file statistics are skipped without it
+    psutil = None
+
+# Shared "no limits" instance; ResourceLimits is frozen so it is safe to reuse
+_NULL_LIMITS = ResourceLimits()
+
+# Size strings such as "2G" or "1.5 m"; units are powers of 1024
+_SIZE_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([BKMGT])\s*$", re.IGNORECASE)
+_SIZE_SHIFTS = {"B": 0, "K": 10, "M": 20, "G": 30, "T": 40}
+
+@functools.lru_cache(maxsize=128)
+def _parse_size(size_str: str) -> int:
+    """Parse size string (e.g., '2G', '500M') to bytes."""
+    match = _SIZE_RE.match(size_str)
+    if match is None:
+        size = size_str.strip()
+        if not size or size[-1].upper() not in _SIZE_SHIFTS:
+            raise ValueError(f"Invalid size unit in {size_str}")
+        raise ValueError(f"Invalid size format: {size_str}")
+
+    number, unit = match.groups()
+    shift = _SIZE_SHIFTS[unit.upper()]
+    if "." in number:
+        return int(float(number) * (1 << shift))
+    return int(number) << shift
+
+_CGROUP_ROOT = "/sys/fs/cgroup"
+
+@functools.lru_cache(maxsize=1)
+def _detect_cgroup() -> Tuple[bool, Optional[int]]:
+    """Return whether the cgroup filesystem is mounted and its version.
+
+    The answer cannot change while we run, so it is computed once.
+    """
+    if not os.path.exists(_CGROUP_ROOT):
+        return False, None
+    if os.path.exists(os.path.join(_CGROUP_ROOT, "cgroup.controllers")):
+        return True, 2
+    return True, 1
+
+def _cgroup_args(limits: ResourceLimits, cgroup_version: Optional[int],
+                 mem_bytes: Optional[int]) -> List[str]:
+    """Setup cgroup constraints."""
+    args = []
+    
+    if cgroup_version is None:
+        return args
+
+    if cgroup_version == 2:
+        # Use cgroup v2
+        if limits.cpu_limit:
+            args.extend([
+                "--bind-data", f"{limits.cpu_limit}",
+                "/sys/fs/cgroup/cpu.max"
+            ])
+            
+        if mem_bytes is not None:
+            args.extend([
+                "--bind-data", f"{mem_bytes}",
+                "/sys/fs/cgroup/memory.max"
+            ])
+            
+        if limits.io_weight:
+            args.extend([
+                "--bind-data", f"{limits.io_weight}",
+                "/sys/fs/cgroup/io.weight"
+            ])
+    else:
+        # Use cgroup v1
+        if limits.cpu_limit:
+            args.extend([
+                "--bind-data", f"{limits.cpu_limit * 1000}",
+                "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+            ])
+            
+        if mem_bytes is not None:
+            args.extend([
+                "--bind-data", f"{mem_bytes}",
+                "/sys/fs/cgroup/memory/memory.limit_in_bytes"
+            ])
+            
+    return args
+
+@functools.lru_cache(maxsize=32)
+def _build_resource_argv(limits: ResourceLimits,
+                         cgroup_version: Optional[int]) -> Tuple[str, ...]:
+    """Get bubblewrap arguments for the given limits.
+
+    ResourceLimits is frozen and hashable, so the argv is shared by every
+    manager created with equal limits.
+    """
+    file_bytes = _parse_size(limits.max_file_size) if limits.max_file_size else None
+
+    # Memory limits, shared by the rlimit and the cgroup setup below
+    mem_bytes = _parse_size(limits.memory_limit) if limits.memory_limit else None
+
+    # Basic resource limits, skipping the ones that are not set
+    rlimits = (
+        ("nproc", limits.max_processes or None),
+        ("nofile", limits.max_files or None),
+        ("fsize", file_bytes),
+        ("as", mem_bytes),
+    )
+    args = [
+        arg
+        for name, value in rlimits
+        if value is not None
+        for arg in ("--rlimit", f"{name}={value}")
+    ]
+
+    # Setup cgroup if available
+    args.extend(_cgroup_args(limits, cgroup_version, mem_bytes))
+    return tuple(args)
 
 class ResourceManager:
     """Manages system resources and limits for isolated applications."""
     
     def __init__(self, limits: Optional[ResourceLimits] = None):
-        self.limits = limits or ResourceLimits()
+        if limits is None or limits == _NULL_LIMITS:
+            limits = _NULL_LIMITS
+        self.limits = limits
         self.logger = logging.getLogger(__name__)
-        self.cgroup_root = Path("/sys/fs/cgroup")
+        self._process: Optional[Any] = None  # psutil.Process, created on first sample
+        self.cgroup_root = _CGROUP_ROOT
         self._validate_cgroup_support()
 
     def _validate_cgroup_support(self):
         """Validate cgroup support on the system."""
-        if not self.cgroup_root.exists():
+        supported, self.cgroup_version = _detect_cgroup()
+        if not supported:
             self.logger.warning("Cgroup filesystem not found, resource limits may not work")
-            return False
-            
-        # Check cgroup version
-        if (self.cgroup_root / "cgroup.controllers").exists():
-            self.cgroup_version = 2
-        else:
-            self.cgroup_version = 1
-            
-        return True
+        return supported
 
     def get_resource_args(self) -> List[str]:
         """Get bubblewrap arguments for resource management."""
-        args = []
-        
-        # Basic resource limits
-        if self.limits.max_processes:
-            args.extend(["--rlimit", f"nproc={self.limits.max_processes}"])
-            
-        if self.limits.max_files:
-            args.extend(["--rlimit", f"nofile={self.limits.max_files}"])
-            
-        if self.limits.max_file_size:
-            size_bytes = self._parse_size(self.limits.max_file_size)
-            args.extend(["--rlimit", f"fsize={size_bytes}"])
-            
-        # Memory limits
-        if self.limits.memory_limit:
-            mem_bytes = self._parse_size(self.limits.memory_limit)
-            args.extend(["--rlimit", f"as={mem_bytes}"])
-            
-        # Setup cgroup if available
-        cgroup_args = self._setup_cgroup()
-        if cgroup_args:
-            args.extend(cgroup_args)
-            
-        return args
-
-    def _setup_cgroup(self) -> List[str]:
-        """Setup cgroup constraints."""
-        args = []
-        
-        if self.cgroup_version == 2:
-            # Use cgroup v2
-            if self.limits.cpu_limit:
-                args.extend([
-                    "--bind-data", f"{self.limits.cpu_limit}",
-                    "/sys/fs/cgroup/cpu.max"
-                ])
-                
-            if self.limits.memory_limit:
-                mem_bytes = self._parse_size(self.limits.memory_limit)
-                args.extend([
-                    "--bind-data", f"{mem_bytes}",
-                    "/sys/fs/cgroup/memory.max"
-                ])
-                
-            if self.limits.io_weight:
-                args.extend([
-                    "--bind-data", f"{self.limits.io_weight}",
-                    "/sys/fs/cgroup/io.weight"
-                ])
-        else:
-            # Use cgroup v1
-            if self.limits.cpu_limit:
-                args.extend([
-                    "--bind-data", f"{self.limits.cpu_limit * 1000}",
-                    "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
-                ])
-                
-            if self.limits.memory_limit:
-                mem_bytes = self._parse_size(self.limits.memory_limit)
-                args.extend([
-                    "--bind-data", f"{mem_bytes}",
-                    "/sys/fs/cgroup/memory/memory.limit_in_bytes"
-                ])
-                
-        return args
-
-    def _parse_size(self, size_str: str) -> int:
-        """Parse size string (e.g., '2G', '500M') to bytes."""
-        units = {
-            'B': 1,
-            'K': 1024,
-            'M': 1024 * 1024,
-            'G': 1024 * 1024 * 1024,
-            'T': 1024 * 1024 * 1024 * 1024
-        }
-        
-        size = size_str.strip()
-        unit = size[-1].upper()
-        if unit not in units:
-            raise ValueError(f"Invalid size unit in {size_str}")
-            
-        try:
-            number = float(size[:-1])
-            return int(number * units[unit])
-        except ValueError:
-            raise ValueError(f"Invalid size format: {size_str}")
+        if self.limits is _NULL_LIMITS:
+            return []
+        # Built on first use so invalid sizes surface where callers handle errors
+        return list(_build_resource_argv(self.limits, self.cgroup_version))
 
     def monitor_resources(self) -> Dict[str, any]:
         """Monitor current resource usage."""
         usage = {}
         
         try:
-            # Memory usage
-            with open("/proc/self/status") as f:
-                for line in f:
-                    if line.startswith("VmRSS:"):
-                        usage["memory_rss"] = int(line.split()[1]) * 1024
-                        break
+            # Memory usage; the status file fits in one page, so read it in one go
+            fd = os.open("/proc/self/status", os.O_RDONLY)
+            try:
+                status = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            start = status.find(b"\nVmRSS:")
+            if start != -1:
+                start += 7
+                end = status.find(b"\n", start)
+                usage["memory_rss"] = int(status[start:end].split()[0]) * 1024
                         
             # CPU usage (requires psutil)
-            import psutil
-            process = psutil.Process()
-            usage["cpu_percent"] = process.cpu_percent()
-            usage["num_threads"] = process.num_threads()
-            usage["open_files"] = len(process.open_files())
+            if psutil is not None:
+                if self._process is None:
+                    self._process = psutil.Process()
+                process = self._process
+                usage["cpu_percent"] = process.cpu_percent()
+                usage["num_threads"] = process.num_threads()
+                usage["open_files"] = len(process.open_files())
             
         except Exception as e:
             self.logger.warning(f"Failed to monitor resources: {e}")
@@ -154,8 +182,12 @@ class ResourceManager:
     def cleanup(self):
         """Clean up any resource management related state."""
         # Remove cgroup if we created one
+        cgroup_path = getattr(self, "cgroup_path", None)
+        if cgroup_path is None:
+            return
         try:
-            if hasattr(self, 'cgroup_path') and self.cgroup_path.exists():
-                self.cgroup_path.rmdir()
+            os.rmdir(cgroup_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.warning(f"Failed to clean up cgroup: {e}")
@@ -1,9 +1,61 @@
 # security_manager.py
 import logging
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..enums import IsolationLevel, ApplicationProfile
 
+# Base security options for all profiles
+_BASE_SECURITY = (
+    "--unshare-pid",      # Isolate process namespace
+    "--unshare-ipc",      # Isolate IPC namespace
+    "--unshare-uts",      # Isolate UTS namespace
+    "--new-session",      # New session
+    "--die-with-parent"   # Clean exit
+)
+
+_BROWSER_ARGS: Tuple[str, ...] = (
+    "--share-net",       # Enable network access
+    "--unshare-user-try",  # Try user namespace isolation
+    "--new-session",      # New session
+    "--cap-add", "ALL",   # Chrome needs full capabilities for its sandbox
+    "--dev-bind", "/dev/shm", "/dev/shm",  # Shared memory
+    "--bind", "/tmp", "/tmp",  # Temporary files
+    "--bind", "/run", "/run"  # Runtime files
+)
+
+# Add seccomp filtering for browsers if available
+_CHROMIUM_SECCOMP = "/usr/share/chromium/seccomp-filter.bpf"
+if os.path.exists(_CHROMIUM_SECCOMP):
+    _BROWSER_ARGS += ("--seccomp", "9", _CHROMIUM_SECCOMP)
+
+_DEFAULT_ARGS = (
+    "--hostname", "isolated"  # Set hostname
+)
+
+_STRICT_EXTRA_ARGS = (
+    "--unshare-net",         # Network isolation
+    "--unshare-cgroup-try",  # Try cgroup isolation
+    "--unshare-user-try",    # Try user namespace isolation
+    "--cap-drop", "ALL"      # Drop all capabilities
+)
+
+_STRICT_DEFAULT_ARGS = _DEFAULT_ARGS + _STRICT_EXTRA_ARGS
+
+# Environment setup; these values do not change while we run
+_ENV_VARS = {
+    "PATH": "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin",
+    "HOME": os.path.expanduser("~"),
+    "USER": os.getenv("USER", ""),
+    "LANG": os.getenv("LANG", "C.UTF-8"),
+    "TERM": os.getenv("TERM", "xterm-256color")
+}
+_ENV_ARGS = tuple(
+    arg
+    for key, value in _ENV_VARS.items()
+    if value  # Only set if value is not empty
+    for arg in ("--setenv", key, value)
+)
+
 class SecurityManager:
     """Handles security-related configurations and policies."""
 
@@ -14,74 +66,24 @@ class SecurityManager:
 
     def get_security_args(self) -> List[str]:
         """Get security-related bubblewrap arguments based on profile and isolation level."""
-        args = []
-
-        # Base security options for all profiles
-        args.extend([
-            "--unshare-pid",      # Isolate process namespace
-            "--unshare-ipc",      # Isolate IPC namespace
-            "--unshare-uts",      # Isolate UTS namespace
-            "--new-session",      # New session
-            "--die-with-parent"   # Clean exit
-        ])
-
         # Profile-specific security settings
         if self.profile == ApplicationProfile.BROWSER:
-            args.extend(self._get_browser_security_args())
+            profile_args = self._get_browser_security_args()
         else:
-            args.extend(self._get_default_security_args())
+            profile_args = self._get_default_security_args()
 
         # Environment setup (must be after namespace setup)
-        env_vars = {
-            "PATH": "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin",
-            "HOME": os.path.expanduser("~"),
-            "USER": os.getenv("USER", ""),
-            "LANG": os.getenv("LANG", "C.UTF-8"),
-            "TERM": os.getenv("TERM", "xterm-256color")
-        }
+        return [*_BASE_SECURITY, *profile_args, *_ENV_ARGS]
 
-        for key, value in env_vars.items():
-            if value:  # Only set if value is not empty
-                args.extend(["--setenv", key, value])
-
-        return args
-
-    def _get_browser_security_args(self) -> List[str]:
+    def _get_browser_security_args(self) -> Tuple[str, ...]:
         """Get security arguments optimized for browser applications."""
-        browser_args = [
-            "--share-net",       # Enable network access
-            "--unshare-user-try",  # Try user namespace isolation
-            "--new-session",      # New session
-            "--cap-add", "ALL",   # Chrome needs full capabilities for its sandbox
-            "--dev-bind", "/dev/shm", "/dev/shm",  # Shared memory
-            "--bind", "/tmp", "/tmp",  # Temporary files
-            "--bind", "/run", "/run"  # Runtime files
-        ]
-
-        # Add seccomp filtering for browsers if available
-        if os.path.exists("/usr/share/chromium/seccomp-filter.bpf"):
-            browser_args.extend([
-                "--seccomp", "9",
-                "/usr/share/chromium/seccomp-filter.bpf"
-            ])
-
-        return browser_args
-
-    def _get_default_security_args(self) -> List[str]:
+        return _BROWSER_ARGS
+
+    def _get_default_security_args(self) -> Tuple[str, ...]:
         """Get default security arguments for non-browser applications."""
-        default_args = [
-            "--hostname", "isolated"  # Set hostname
-        ]
-        
         if self.isolation_level == IsolationLevel.STRICT:
-            default_args.extend([
-                "--unshare-net",         # Network isolation
-                "--unshare-cgroup-try",  # Try cgroup isolation
-                "--unshare-user-try",    # Try user namespace isolation
-                "--cap-drop", "ALL"      # Drop all capabilities
-            ])
-
-        return default_args
+            return _STRICT_DEFAULT_ARGS
+        return _DEFAULT_ARGS
 
     def validate_security_config(self) -> bool:
         """Validate the security configuration."""